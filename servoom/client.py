@@ -7,14 +7,21 @@ This class just wires them together with auth.
 
 from __future__ import annotations
 
+import hashlib
+import json
+import logging
 import os
-from typing import Dict, List, Optional, Tuple
+import shutil
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
+from typing import Dict, Iterator, List, Optional, Tuple
 
-from . import csv_export
 from .config import DEFAULT_SETTINGS, Settings
 from .const import ApiEndpoint, Server
 from .credentials import load_credentials
-from .http import DivoomSession, paginate
+from .http import DivoomSession, paginate, paginate_concurrent
 from .logging import get_logger
 from .pixel_bean import PixelBean, PixelBeanState
 from .pixel_bean_decoder import PixelBeanDecoder
@@ -22,6 +29,46 @@ from .util import sanitize_filename, safe_console_text
 
 log = get_logger(__name__)
 
+# Built once; download_art appends only the FileId per file.
+_FILE_URL_PREFIX = f"https://{Server.FILE.value}/"
+
+# Downloads below this size are read in one shot instead of streamed.
+_STREAM_THRESHOLD = 1 << 20
+_DOWNLOAD_CHUNK_SIZE = 1 << 18
+
+# Constant parts of the listing payloads, frozen once at import; per-call fields
+# (filters, ids, **extra) are layered on top with a single dict-unpack.
+_MY_UPLOADS_TEMPLATE = MappingProxyType({"Version": 99, "RefreshIndex": 0, "FileSort": 0})
+_SOMEONE_LIST_TEMPLATE = MappingProxyType(
+    {"Version": 99, "ShowAllFlag": 1, "RefreshIndex": 0, "FileSort": 0})
+_CATEGORY_FILES_TEMPLATE = MappingProxyType(
+    {"FileType": 5, "FileSort": 0, "Version": 12, "RefreshIndex": 0})
+
+# Gallery metadata is effectively immutable, so a small cache is safe.
+_INFO_CACHE_SIZE = 4096
+# Tag/user lookups change slowly; cached per (endpoint, payload) key.
+_LOOKUP_CACHE_SIZE = 1024
+
+
+def _lookup_cache_key(endpoint: str, payload: Dict) -> str:
+    """Stable key for a lookup: endpoint plus sorted payload (auth excluded)."""
+    blob = json.dumps([endpoint, sorted(payload.items())], separators=(",", ":"),
+                      ensure_ascii=False, default=str)
+    return hashlib.md5(blob.encode("utf-8")).hexdigest()
+
+# One pool for all clients: decode work is CPU-bound, so more pools would only
+# add contention. Created on first use, never torn down (daemon threads).
+_decode_pool: Optional[ThreadPoolExecutor] = None
+
+
+def _get_decode_pool() -> ThreadPoolExecutor:
+    global _decode_pool
+    if _decode_pool is None:
+        _decode_pool = ThreadPoolExecutor(
+            max_workers=os.cpu_count() or 1, thread_name_prefix="servoom-decode"
+        )
+    return _decode_pool
+
 
 class DivoomClient:
     """Client for the Divoom cloud API. Call :meth:`login` before any fetch/download."""
@@ -40,6 +87,10 @@ class DivoomClient:
         self._session = DivoomSession(settings)
         self.token: Optional[str] = None
         self.user_id: Optional[int] = None
+        self._auth_payload: Optional[Dict] = None
+        # Both caches map key -> (stored_at, response); see _cache_get.
+        self._info_cache: OrderedDict[int, Tuple[float, Dict]] = OrderedDict()
+        self._lookup_cache: OrderedDict[str, Tuple[float, Dict]] = OrderedDict()
 
     # -- auth ---------------------------------------------------------------
     def login(self) -> bool:
@@ -51,19 +102,40 @@ class DivoomClient:
             )
             self.user_id = resp["UserId"]
             self.token = resp["Token"]
+            self._auth_payload = {"Token": self.token, "UserId": self.user_id}
             log.info("Logged in to Divoom API")
             return True
         except Exception as exc:
             log.error("Login failed: %s", exc)
             return False
 
+    def close(self) -> None:
+        """Release the underlying HTTP connection pool."""
+        self._session.close()
+
+    def __enter__(self) -> "DivoomClient":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
     def is_logged_in(self) -> bool:
         return self.token is not None and self.user_id is not None
 
     def _auth(self) -> Dict:
-        if not self.is_logged_in():
+        # Built once in login() so per-call checks reduce to a single None test.
+        if self._auth_payload is None:
             raise ValueError("Not logged in! Call login() first.")
-        return {"Token": self.token, "UserId": self.user_id}
+        return self._auth_payload
+
+    def _payload(self, payload: Dict) -> Dict:
+        """Merge auth into ``payload``, dropping ``None`` values.
+
+        Computed once per fetch (not per page — :func:`~servoom.http.paginate`
+        reuses its base payload), so ``**extra`` kwargs cost nothing in the
+        paging loop. Passing ``Foo=None`` removes a default field entirely.
+        """
+        return {k: v for k, v in {**self._auth(), **payload}.items() if v is not None}
 
     def _keep(self, item: Dict) -> bool:
         """Pagination predicate: drop hidden artworks when configured to respect HideFlag."""
@@ -71,25 +143,48 @@ class DivoomClient:
             return False
         return True
 
-    def _list(self, endpoint: ApiEndpoint, payload: Dict, *, limit: Optional[int],
-              list_keys=("FileList",)) -> List[Dict]:
-        """Run a paginated listing and return all kept items."""
-        items = list(paginate(
-            self._session.post_json,
-            endpoint.value,
-            {**self._auth(), **payload},
+    def _iter(self, endpoint: ApiEndpoint, payload: Dict, *, limit: Optional[int],
+              list_keys=("FileList",), prefetch: bool = False) -> Iterator[Dict]:
+        """Yield kept items from a paginated listing as pages arrive."""
+        kwargs = dict(
             batch_size=self._settings.batch_size,
             list_keys=list_keys,
             keep=self._keep,
             limit=limit,
-            on_page=lambda start, total: log.info("  %s: %d collected", endpoint.name, total),
-        ))
+            # No callback at all when INFO is off — paginate() then skips the call.
+            on_page=(lambda start, total: log.info("  %s: %d collected", endpoint.name, total))
+            if log.isEnabledFor(logging.INFO) else None,
+        )
+        if self._settings.parallel_pages > 1:
+            return paginate_concurrent(
+                self._session.post_json, endpoint.value, self._payload(payload),
+                workers=self._settings.parallel_pages, **kwargs,
+            )
+        return paginate(
+            self._session.post_json, endpoint.value, self._payload(payload),
+            prefetch=prefetch, **kwargs,
+        )
+
+    def _list(self, endpoint: ApiEndpoint, payload: Dict, *, limit: Optional[int],
+              list_keys=("FileList",)) -> List[Dict]:
+        """Run a paginated listing and return all kept items."""
+        items = list(self._iter(endpoint, payload, limit=limit, list_keys=list_keys))
         log.info("Fetched %d items from %s", len(items), endpoint.name)
         return items
 
     # -- single artwork -----------------------------------------------------
-    def fetch_artwork_info(self, gallery_id: int) -> Optional[Dict]:
-        """Fetch artwork metadata by gallery ID (or None on error)."""
+    def fetch_artwork_info(self, gallery_id: int, force_refresh: bool = False
+                           ) -> Optional[Dict]:
+        """Fetch artwork metadata by gallery ID (or None on error).
+
+        Metadata is effectively immutable, so results are cached: an in-memory
+        LRU always, plus one JSON file per gallery under ``settings.cache_dir``
+        when that is set. Pass ``force_refresh=True`` to bypass both.
+        """
+        if not force_refresh:
+            cached = self._cached_info(gallery_id)
+            if cached is not None:
+                return cached
         resp = self._session.post_json(
             ApiEndpoint.GET_GALLERY_INFO.value, {**self._auth(), "GalleryId": gallery_id}
         )
@@ -97,8 +192,74 @@ class DivoomClient:
             log.error("fetch_artwork_info failed: ReturnCode %s", resp.get("ReturnCode"))
             return None
         resp["GalleryId"] = gallery_id  # not always echoed back
+        self._store_info(gallery_id, resp)
         return resp
 
+    def clear_cache(self) -> None:
+        """Drop cached artwork metadata and lookups (memory and, if configured, disk)."""
+        self._info_cache.clear()
+        self._lookup_cache.clear()
+        cache_dir = self._settings.cache_dir
+        if cache_dir and os.path.isdir(cache_dir):
+            for name in os.listdir(cache_dir):
+                if name.endswith(".json"):
+                    try:
+                        os.remove(os.path.join(cache_dir, name))
+                    except OSError:
+                        pass
+
+    # -- cache plumbing (memory LRU + optional per-entry JSON files) ---------
+    def _disk_cache_path(self, name: str) -> Optional[str]:
+        cache_dir = self._settings.cache_dir
+        return os.path.join(cache_dir, f"{name}.json") if cache_dir else None
+
+    def _cache_get(self, memory: OrderedDict, key, disk_name: str,
+                   ttl: Optional[float] = None) -> Optional[Dict]:
+        """Entries are (stored_at, value); ``ttl=None`` means they never expire.
+        Disk entries use the file's mtime as their timestamp."""
+        now = time.time()
+        if key in memory:
+            stored_at, value = memory[key]
+            if ttl is None or now - stored_at < ttl:
+                memory.move_to_end(key)
+                return value
+            del memory[key]
+        path = self._disk_cache_path(disk_name)
+        if path and os.path.exists(path):
+            stored_at = os.path.getmtime(path)
+            if ttl is not None and now - stored_at >= ttl:
+                return None
+            try:
+                with open(path, "r", encoding="utf-8") as fh:
+                    value = json.load(fh)
+            except (OSError, ValueError):
+                return None
+            memory[key] = (stored_at, value)
+            return value
+        return None
+
+    def _cache_put(self, memory: OrderedDict, key, disk_name: str, value: Dict,
+                   max_entries: int) -> None:
+        memory[key] = (time.time(), value)
+        memory.move_to_end(key)
+        while len(memory) > max_entries:
+            memory.popitem(last=False)
+        path = self._disk_cache_path(disk_name)
+        if path:
+            try:
+                os.makedirs(self._settings.cache_dir, exist_ok=True)
+                with open(path, "w", encoding="utf-8") as fh:
+                    json.dump(value, fh)
+            except OSError as exc:
+                log.debug("Could not write cache %s: %s", path, exc)
+
+    def _cached_info(self, gallery_id: int) -> Optional[Dict]:
+        return self._cache_get(self._info_cache, gallery_id, str(gallery_id))
+
+    def _store_info(self, gallery_id: int, info: Dict) -> None:
+        self._cache_put(self._info_cache, gallery_id, str(gallery_id), info,
+                        _INFO_CACHE_SIZE)
+
     def download_art_by_id(self, gallery_id: int, output_dir: Optional[str] = None
                            ) -> Tuple[PixelBean, str]:
         """Fetch metadata, build a PixelBean, and download its file."""
@@ -124,12 +285,27 @@ class DivoomClient:
         output_path = os.path.join(output_dir, f"{pixel_bean.gallery_id}_{name}.dat")
 
         try:
-            resp = self._session.get(f"https://{Server.FILE.value}/{file_id}", stream=True)
+            resp = self._session.get(_FILE_URL_PREFIX + file_id, stream=True)
             resp.raise_for_status()
-            with open(output_path, "wb") as fh:
-                for chunk in resp.iter_content(chunk_size=8192):
-                    if chunk:
-                        fh.write(chunk)
+            size = int(resp.headers.get("Content-Length", 0))
+            if 0 < size < _STREAM_THRESHOLD:
+                # Typical .dat files are a few KB; skip the chunked generator.
+                with open(output_path, "wb") as fh:
+                    fh.write(resp.content)
+            else:
+                fd = os.open(output_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+                # Hint the final size so the filesystem can allocate contiguous
+                # extents (no-op where posix_fallocate is unavailable, e.g. Windows).
+                if size and hasattr(os, "posix_fallocate"):
+                    try:
+                        os.posix_fallocate(fd, 0, size)
+                    except OSError:
+                        pass
+                # copyfileobj runs the read/write loop at C level; decode_content
+                # keeps transparent gzip/br decompression chunk-by-chunk.
+                resp.raw.decode_content = True
+                with os.fdopen(fd, "wb", buffering=_DOWNLOAD_CHUNK_SIZE) as fh:
+                    shutil.copyfileobj(resp.raw, fh, length=_DOWNLOAD_CHUNK_SIZE)
         except Exception as exc:
             raise RuntimeError(f"Failed to download file: {exc}") from exc
 
@@ -160,29 +336,61 @@ class DivoomClient:
         log.info("Decoded: %s", safe_console_text(os.path.basename(file_path)))
         return pixel_bean
 
+    def decode_many(self, beans: List[PixelBean]) -> List[PixelBean]:
+        """Decode downloaded beans concurrently on a shared thread pool.
+
+        The heavy lifting (LZO/zstd decompression, numpy reshaping) releases the
+        GIL, so threads overlap well. Beans that fail to decode are logged and
+        skipped; the successfully decoded ones are returned.
+        """
+        decoded = []
+        futures = [_get_decode_pool().submit(self.decode_art, bean) for bean in beans]
+        for i, future in enumerate(futures, 1):
+            try:
+                decoded.append(future.result())
+            except Exception as exc:
+                log.warning("  [%d/%d] Failed to decode %s: %s",
+                            i, len(beans), beans[i - 1].gallery_id or i, exc)
+        log.info("Decoded %d/%d beans", len(decoded), len(beans))
+        return decoded
+
     # -- listings -----------------------------------------------------------
+    def _my_arts_payload(self, extra: Dict) -> Dict:
+        return {**_MY_UPLOADS_TEMPLATE, "FileSize": self._settings.file_size_filter, **extra}
+
+    def _someone_arts_payload(self, target_user_id: int, extra: Dict) -> Dict:
+        return {**_SOMEONE_LIST_TEMPLATE, "SomeOneUserId": target_user_id,
+                "FileSize": self._settings.file_size_filter, **extra}
+
     def fetch_my_arts(self, limit: Optional[int] = None, **extra) -> List[Dict]:
         """List the current user's uploads."""
-        return self._list(ApiEndpoint.GET_MY_UPLOADS, {
-            "Version": 99, "FileSize": self._settings.file_size_filter,
-            "RefreshIndex": 0, "FileSort": 0, **extra,
-        }, limit=limit)
+        return self._list(ApiEndpoint.GET_MY_UPLOADS, self._my_arts_payload(extra),
+                          limit=limit)
+
+    def iter_my_arts(self, limit: Optional[int] = None, **extra) -> Iterator[Dict]:
+        """Yield the current user's uploads as pages arrive (one-page prefetch)."""
+        return self._iter(ApiEndpoint.GET_MY_UPLOADS, self._my_arts_payload(extra),
+                          limit=limit, prefetch=True)
 
     def fetch_someone_arts(self, target_user_id: int, limit: Optional[int] = None,
                            **extra) -> List[Dict]:
         """List uploads by ``target_user_id``."""
-        return self._list(ApiEndpoint.GET_SOMEONE_LIST, {
-            "Version": 99, "ShowAllFlag": 1, "SomeOneUserId": target_user_id,
-            "FileSize": self._settings.file_size_filter, "RefreshIndex": 0, "FileSort": 0,
-            **extra,
-        }, limit=limit)
+        return self._list(ApiEndpoint.GET_SOMEONE_LIST,
+                          self._someone_arts_payload(target_user_id, extra), limit=limit)
+
+    def iter_someone_arts(self, target_user_id: int, limit: Optional[int] = None,
+                          **extra) -> Iterator[Dict]:
+        """Yield uploads by ``target_user_id`` as pages arrive (one-page prefetch)."""
+        return self._iter(ApiEndpoint.GET_SOMEONE_LIST,
+                          self._someone_arts_payload(target_user_id, extra),
+                          limit=limit, prefetch=True)
 
     def fetch_category_files(self, category_id: int, limit: Optional[int] = None,
                              **extra) -> List[Dict]:
         """List files in a gallery category."""
         return self._list(ApiEndpoint.GET_CATEGORY_FILES, {
-            "Classify": category_id, "FileSize": self._settings.file_size_filter,
-            "FileType": 5, "FileSort": 0, "Version": 12, "RefreshIndex": 0, **extra,
+            **_CATEGORY_FILES_TEMPLATE, "Classify": category_id,
+            "FileSize": self._settings.file_size_filter, **extra,
         }, limit=limit, list_keys=("FileList", "CategoryFileList"))
 
     def fetch_tag_gallery(self, tag_name: str, limit: Optional[int] = None,
@@ -202,38 +410,73 @@ class DivoomClient:
                           limit=limit, list_keys=("UserList",))
 
     # -- single-shot lookups ------------------------------------------------
-    def _lookup(self, endpoint: ApiEndpoint, payload: Dict) -> Optional[Dict]:
-        resp = self._session.post_json(endpoint.value, {**self._auth(), **payload})
+    def _lookup(self, endpoint: ApiEndpoint, payload: Dict, *, cache: bool = False,
+                force_refresh: bool = False) -> Optional[Dict]:
+        """POST a single lookup. With ``cache=True``, successful responses are
+        memoized (memory LRU + ``settings.cache_dir``) keyed by endpoint and
+        payload — the auth fields are excluded so caches survive re-login."""
+        key = _lookup_cache_key(endpoint.value, payload) if cache else None
+        if key and not force_refresh:
+            hit = self._cache_get(self._lookup_cache, key, f"lookup_{key}",
+                                  ttl=self._settings.cache_ttl)
+            if hit is not None:
+                return hit
+        resp = self._session.post_json(endpoint.value, self._payload(payload))
         if resp.get("ReturnCode", 0) != 0:
             log.error("%s failed: ReturnCode %s", endpoint.name, resp.get("ReturnCode"))
             return None
+        if key:
+            self._cache_put(self._lookup_cache, key, f"lookup_{key}", resp,
+                            _LOOKUP_CACHE_SIZE)
         return resp
 
-    def fetch_someone_info(self, target_user_id: int, **extra) -> Optional[Dict]:
-        """Fetch a user's profile."""
+    def fetch_someone_info(self, target_user_id: int, force_refresh: bool = False,
+                           **extra) -> Optional[Dict]:
+        """Fetch a user's profile (cached; ``force_refresh=True`` re-fetches)."""
         return self._lookup(ApiEndpoint.GET_SOMEONE_INFO,
-                            {"SomeOneUserId": target_user_id, **extra})
-
-    def fetch_tag_info(self, tag_name: str, **extra) -> Optional[Dict]:
-        """Fetch metadata for a tag."""
-        return self._lookup(ApiEndpoint.GET_TAG_INFO, {"TagName": tag_name, **extra})
-
-    def search_user(self, query: str, **extra) -> List[Dict]:
-        """Search for users by keyword."""
-        resp = self._lookup(ApiEndpoint.SEARCH_USER, {"Keywords": query, **extra})
+                            {"SomeOneUserId": target_user_id, **extra},
+                            cache=True, force_refresh=force_refresh)
+
+    def fetch_tag_info(self, tag_name: str, force_refresh: bool = False,
+                       **extra) -> Optional[Dict]:
+        """Fetch metadata for a tag (cached; ``force_refresh=True`` re-fetches)."""
+        return self._lookup(ApiEndpoint.GET_TAG_INFO, {"TagName": tag_name, **extra},
+                            cache=True, force_refresh=force_refresh)
+
+    def search_user(self, query: str, force_refresh: bool = False, **extra) -> List[Dict]:
+        """Search for users by keyword (cached; ``force_refresh=True`` re-fetches)."""
+        resp = self._lookup(ApiEndpoint.SEARCH_USER, {"Keywords": query, **extra},
+                            cache=True, force_refresh=force_refresh)
         return (resp or {}).get("UserList", [])
 
-    def search_tag(self, query: str, **extra) -> List[Dict]:
-        """Search for tags by keyword."""
-        resp = self._lookup(ApiEndpoint.SEARCH_TAG, {"Keywords": query, **extra})
+    def search_tag(self, query: str, force_refresh: bool = False, **extra) -> List[Dict]:
+        """Search for tags by keyword (cached; ``force_refresh=True`` re-fetches)."""
+        resp = self._lookup(ApiEndpoint.SEARCH_TAG, {"Keywords": query, **extra},
+                            cache=True, force_refresh=force_refresh)
         return (resp or {}).get("TagList", [])
 
+    def batch_fetch_tag_info(self, tag_names: List[str], max_workers: int = 8
+                             ) -> List[Optional[Dict]]:
+        """Fetch metadata for many tags concurrently, preserving order.
+
+        The shared session's pool is sized for this (urllib3's pools are
+        thread-safe), so the lookups overlap on the network; cached tags are
+        answered without a request at all.
+        """
+        with ThreadPoolExecutor(max_workers=max_workers,
+                                thread_name_prefix="servoom-lookup") as pool:
+            return list(pool.map(self.fetch_tag_info, tag_names))
+
     # -- bean/download convenience -----------------------------------------
     def fetch_my_arts_as_beans(self, **kwargs) -> List[PixelBean]:
-        return [PixelBean(metadata=art) for art in self.fetch_my_arts(**kwargs)]
+        # Items come straight from the parsed response and are never touched
+        # again here, so the beans can adopt them without a copy each.
+        return [PixelBean(metadata=art, _share_metadata=True)
+                for art in self.fetch_my_arts(**kwargs)]
 
     def fetch_someone_arts_as_beans(self, target_user_id: int, **kwargs) -> List[PixelBean]:
-        return [PixelBean(metadata=a) for a in self.fetch_someone_arts(target_user_id, **kwargs)]
+        return [PixelBean(metadata=a, _share_metadata=True)
+                for a in self.fetch_someone_arts(target_user_id, **kwargs)]
 
     def download_my_arts(self, output_dir: Optional[str] = None, **kwargs) -> List[str]:
         """Download every upload of the current user."""
@@ -254,13 +497,28 @@ class DivoomClient:
             log.info("No arts to download")
             return []
         log.info("Downloading %d files to %s", len(beans), output_dir)
+        workers = min(self._settings.download_workers, len(beans))
         paths = []
-        for i, bean in enumerate(beans, 1):
-            try:
-                paths.append(self.download_art(bean, output_dir=output_dir))
-            except Exception as exc:
-                log.warning("  [%d/%d] Failed to download %s: %s",
-                            i, len(beans), bean.gallery_id or i, exc)
+        if workers > 1:
+            # Independent small GETs against the file server: embarrassingly
+            # parallel, and the session's pool holds enough sockets.
+            with ThreadPoolExecutor(max_workers=workers,
+                                    thread_name_prefix="servoom-download") as pool:
+                futures = [pool.submit(self.download_art, bean, output_dir=output_dir)
+                           for bean in beans]
+                for i, future in enumerate(futures, 1):
+                    try:
+                        paths.append(future.result())
+                    except Exception as exc:
+                        log.warning("  [%d/%d] Failed to download %s: %s",
+                                    i, len(beans), beans[i - 1].gallery_id or i, exc)
+        else:
+            for i, bean in enumerate(beans, 1):
+                try:
+                    paths.append(self.download_art(bean, output_dir=output_dir))
+                except Exception as exc:
+                    log.warning("  [%d/%d] Failed to download %s: %s",
+                                i, len(beans), bean.gallery_id or i, exc)
         log.info("Downloaded %d/%d files to %s", len(paths), len(beans), output_dir)
         return paths
 
@@ -268,6 +526,8 @@ class DivoomClient:
                                output_dir: Optional[str] = None, include_tags: bool = True
                                ) -> Dict[str, str]:
         """Export artwork metadata to CSV (delegates to :mod:`servoom.csv_export`)."""
+        from . import csv_export  # imported lazily; unused in download-only flows
+
         return csv_export.export_artworks_to_csv(
             beans, base_filename=base_filename,
             output_dir=output_dir or self._settings.output_dir, include_tags=include_tags,
@@ -7,13 +7,28 @@ CSV field mappings in :mod:`servoom.csv_export`. This module is deliberately sma
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Dict
+from typing import Dict, Optional
 
 USER_AGENT = "Aurabox/3.1.10 (iPad; iOS 14.8; Scale/2.00)"
 
+
+def _accept_encoding() -> str:
+    """Advertise brotli only when a decoder is importable, else urllib3 would
+    receive bodies it cannot decompress."""
+    try:
+        import brotli  # noqa: F401  (brotli or brotlicffi enable urllib3's br support)
+    except ImportError:
+        try:
+            import brotlicffi  # noqa: F401
+        except ImportError:
+            return "gzip, deflate"
+    return "gzip, deflate, br"
+
+
 DEFAULT_HEADERS: Dict[str, str] = {
     "User-Agent": USER_AGENT,
     "Content-Type": "application/json",
+    "Accept-Encoding": _accept_encoding(),
 }
 
 # Bitmap flag selecting which artwork sizes the gallery endpoints return (16..256 px).
@@ -30,8 +45,21 @@ class Settings:
     retry_delay: int = 1  # seconds between retries
     file_size_filter: int = ALL_FILE_SIZES
     respect_hide_flag: bool = True
+    # Pages fetched concurrently per wave during listings (1 = strictly serial).
+    parallel_pages: int = 1
+    # Files downloaded concurrently by the bulk download helpers (1 = serial).
+    download_workers: int = 8
+    # Outbound requests per second across all threads; None = unshaped. Set
+    # this when raising the concurrency knobs to stay under the server's
+    # rate limiter instead of burning the retry budget on 429s.
+    rate_limit_rps: Optional[float] = None
     headers: Dict[str, str] = field(default_factory=lambda: dict(DEFAULT_HEADERS))
     output_dir: str = "out"
+    # Directory for cached artwork metadata; None disables the disk cache.
+    cache_dir: Optional[str] = None
+    # Seconds before cached lookups (profiles, tags, searches) go stale;
+    # None means they never expire. Artwork metadata is immutable and exempt.
+    cache_ttl: Optional[float] = 3600.0
 
 
 DEFAULT_SETTINGS = Settings()
@@ -0,0 +1,75 @@
+"""Credential resolution for the Divoom cloud API.
+
+Decoding local files needs no credentials; only :class:`~servoom.client.DivoomClient`
+resolves them. The account password is never sent in plain text — the API expects its
+MD5 hex digest. Resolution order:
+
+1. explicit ``email`` / ``md5_password`` (or plain ``password``) arguments,
+2. environment variables ``SERVOOM_EMAIL`` / ``SERVOOM_MD5_PASSWORD``,
+3. a git-ignored ``credentials.py`` on ``sys.path`` defining ``CONFIG_EMAIL`` and
+   ``CONFIG_MD5_PASSWORD``.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+from dataclasses import dataclass
+from typing import Optional
+
+
+class CredentialsError(Exception):
+    """Raised when no usable credentials can be resolved."""
+
+
+@dataclass(frozen=True)
+class Credentials:
+    """A resolved (email, md5_password) pair."""
+
+    email: str
+    md5_password: str
+
+
+def _from_config_module() -> Optional[Credentials]:
+    try:
+        import credentials  # type: ignore[import-not-found]
+    except ImportError:
+        return None
+    email = getattr(credentials, "CONFIG_EMAIL", None)
+    md5_password = getattr(credentials, "CONFIG_MD5_PASSWORD", None)
+    if email and md5_password:
+        return Credentials(email=email, md5_password=md5_password)
+    return None
+
+
+def load_credentials(
+    email: Optional[str] = None,
+    md5_password: Optional[str] = None,
+    password: Optional[str] = None,
+) -> Credentials:
+    """Resolve credentials from arguments, the environment, or ``credentials.py``.
+
+    A plain ``password`` is hashed locally and never stored. Raises
+    :class:`CredentialsError` if nothing usable is found.
+    """
+    if password and not md5_password:
+        md5_password = hashlib.md5(password.encode("utf-8")).hexdigest()
+
+    email = email or os.environ.get("SERVOOM_EMAIL")
+    md5_password = md5_password or os.environ.get("SERVOOM_MD5_PASSWORD")
+    if email and md5_password:
+        return Credentials(email=email, md5_password=md5_password)
+
+    from_module = _from_config_module()
+    if from_module:
+        # Arguments may cover one half; the config module fills in the rest.
+        return Credentials(
+            email=email or from_module.email,
+            md5_password=md5_password or from_module.md5_password,
+        )
+
+    raise CredentialsError(
+        "No credentials found. Set SERVOOM_EMAIL and SERVOOM_MD5_PASSWORD, create a "
+        "credentials.py with CONFIG_EMAIL/CONFIG_MD5_PASSWORD, or pass email/password "
+        "to DivoomClient."
+    )
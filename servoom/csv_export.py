@@ -13,6 +13,7 @@ from datetime import datetime
 from typing import Dict, List, Optional
 
 from .logging import get_logger
+from .util import convert_epoch_to_local
 
 log = get_logger(__name__)
 
@@ -74,7 +75,7 @@ def _row_from_metadata(metadata: Dict) -> Dict[str, str]:
             continue
         value = metadata[key]
         if key == "Date":
-            value = datetime.fromtimestamp(value).strftime("%Y-%m-%d %H:%M:%S")
+            value = convert_epoch_to_local(value)
         elif key == "FileSize":
             value = str(value)
         row[header] = value
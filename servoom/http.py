@@ -5,21 +5,90 @@ Two things live here so the client doesn't have to repeat them a dozen times:
 * :class:`DivoomSession` — one place that builds URLs, sets headers/timeout, retries on
   transient network errors, and parses JSON.
 * :func:`paginate` — the single ``StartNum``/``EndNum`` loop every listing endpoint uses.
+* :func:`paginate_concurrent` — the same loop with a thread-pool wave of page prefetch.
 """
 
 from __future__ import annotations
 
+import json
+import logging
+import random
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from .config import DEFAULT_SETTINGS, Settings
 from .const import Server
 from .logging import get_logger
 
+try:  # optional fast JSON; stdlib is the fallback
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
 log = get_logger(__name__)
 
+# Ceiling for exponential retry backoff, seconds.
+_BACKOFF_CAP = 30.0
+
+
+def _backoff_delay(base: float, attempt: int) -> float:
+    """Exponential backoff with up to 50% jitter, capped at ``_BACKOFF_CAP``."""
+    return min(base * (2 ** attempt) * (1 + random.random() * 0.5), _BACKOFF_CAP)
+
+
+def _parse_json(resp: requests.Response) -> Dict:
+    """Parse a JSON response body, preferring orjson.
+
+    ``Response.json()`` goes through charset detection and stdlib ``json``;
+    Divoom responses are always UTF-8 JSON, so orjson can parse the raw bytes
+    directly. ``orjson.JSONDecodeError`` subclasses ``ValueError``, matching
+    the stdlib failure mode for callers.
+    """
+    if orjson is not None:
+        return orjson.loads(resp.content)
+    return resp.json()
+
+
+def _dump_pretty(obj) -> str:
+    """Pretty-print ``obj`` for debug logs. Only called when DEBUG is enabled."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(obj, indent=2, ensure_ascii=False)
+
+
+class _TokenBucket:
+    """Thread-safe token bucket: ``acquire()`` blocks until a token is free.
+
+    Shapes outbound request rate so the concurrent pagination/download paths
+    don't trip the server's rate limiter and dogpile on 429 retries.
+    """
+
+    def __init__(self, rate: float):
+        self._rate = rate
+        self._capacity = max(rate * 2, 1.0)  # allow short bursts
+        self._tokens = self._capacity
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self._capacity,
+                                   self._tokens + (now - self._last) * self._rate)
+                self._last = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self._rate
+            time.sleep(wait)
+
 
 class DivoomSession:
     """Thin wrapper over ``requests.Session`` for the Divoom JSON API."""
@@ -28,6 +97,22 @@ class DivoomSession:
         self._settings = settings
         self._session = requests.Session()
         self._session.headers.update(settings.headers)
+        # Size the urllib3 pool for the two Divoom hosts (API + file server) and
+        # enough sockets that concurrent callers keep connections alive too.
+        # Status retries (429/5xx) back off exponentially inside urllib3;
+        # transport errors stay with post_json's own retry loop (connect/read=0
+        # here so the two policies never stack).
+        retry = Retry(
+            total=None, connect=0, read=0, redirect=0, other=0,
+            status=settings.max_retries, backoff_factor=0.5,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=frozenset(("GET", "POST")),
+        )
+        self._session.mount(
+            "https://", HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=retry)
+        )
+        self._bucket = (_TokenBucket(settings.rate_limit_rps)
+                        if settings.rate_limit_rps else None)
 
     @staticmethod
     def url(path: str, server: Server = Server.API) -> str:
@@ -43,23 +128,58 @@ class DivoomSession:
         final response body is not JSON.
         """
         url = self.url(path)
+        # Guarded so the pretty-printer never runs (or allocates) on the hot path.
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("POST %s payload:\n%s", url, _dump_pretty(payload or {}))
+        # Serialize once, outside the retry loop; requests' ``json=`` would
+        # re-encode with stdlib json on every attempt. The session's
+        # Content-Type header already says application/json.
+        body = (orjson.dumps(payload or {}) if orjson is not None
+                else json.dumps(payload or {}).encode())
         last_exc: Optional[Exception] = None
         for attempt in range(self._settings.max_retries):
+            if self._bucket is not None:
+                self._bucket.acquire()  # retries are shaped too
             try:
                 resp = self._session.post(
-                    url, json=payload or {}, timeout=self._settings.request_timeout
+                    url, data=body, timeout=self._settings.request_timeout
                 )
-                return resp.json()
             except requests.RequestException as exc:
                 last_exc = exc
                 if attempt < self._settings.max_retries - 1:
-                    time.sleep(self._settings.retry_delay)
+                    time.sleep(_backoff_delay(self._settings.retry_delay, attempt))
+                continue
+            if log.isEnabledFor(logging.DEBUG):
+                # The raw bytes are already a readable JSON document; decoding
+                # them beats a parse + pretty-reserialize round-trip.
+                log.debug("Response from %s (HTTP %s):\n%s", path, resp.status_code,
+                          resp.content.decode("utf-8", errors="replace"))
+            try:
+                return _parse_json(resp)
+            except ValueError:
+                # An HTML error page, not a flaky connection: log a bounded
+                # snippet and fail immediately instead of retrying.
+                log.warning("Non-JSON response from %s (HTTP %s): %.500s",
+                            path, resp.status_code, resp.text)
+                raise
         raise last_exc  # type: ignore[misc]
 
     def get(self, url: str, **kwargs) -> requests.Response:
+        if self._bucket is not None:
+            self._bucket.acquire()
         kwargs.setdefault("timeout", self._settings.request_timeout)
         return self._session.get(url, **kwargs)
 
+    def close(self) -> None:
+        """Release the pooled connections."""
+        self._session.close()
+
+    def __enter__(self) -> "DivoomSession":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
 
 def _first_nonempty_list(data: Dict, keys: Sequence[str]) -> List[Dict]:
     for key in keys:
@@ -79,6 +199,7 @@ def paginate(
     keep: Optional[Callable[[Dict], bool]] = None,
     limit: Optional[int] = None,
     on_page: Optional[Callable[[int, int], None]] = None,
+    prefetch: bool = False,
 ) -> Iterator[Dict]:
     """Yield items across paginated ``StartNum``/``EndNum`` requests.
 
@@ -91,35 +212,167 @@ def paginate(
         keep: predicate; items for which it returns ``False`` are skipped.
         limit: stop after yielding this many items (``None`` = no limit).
         on_page: optional ``(start, running_total)`` progress callback.
+        prefetch: keep the next page's request in flight on a background thread
+            while the current page's items are consumed, so consumers overlap
+            their work with one page of network latency.
 
     Stops on: an error ``ReturnCode``, a page with no items, a non-JSON body, or ``limit``.
     """
     keep = keep or (lambda _item: True)
     start = 1
     collected = 0
-    while True:
+    pool = (ThreadPoolExecutor(max_workers=1, thread_name_prefix="servoom-prefetch")
+            if prefetch else None)
+    next_future = None
+    # Copied once; only the two window fields change between pages. The
+    # prefetch path builds fresh dicts instead: a worker thread may still be
+    # serializing the previous one.
+    payload = dict(base_payload)
+
+    def request(start_num: int) -> Dict:
+        return post(path, {**base_payload, "StartNum": start_num,
+                           "EndNum": start_num + batch_size - 1})
+
+    try:
+        while True:
+            try:
+                if next_future is not None:
+                    data, next_future = next_future.result(), None
+                elif pool is not None:
+                    data = request(start)
+                else:
+                    payload["StartNum"] = start
+                    payload["EndNum"] = start + batch_size - 1
+                    data = post(path, payload)
+            except ValueError:
+                log.warning("Non-JSON response for %s at StartNum=%d", path, start)
+                return
+            except requests.RequestException as exc:
+                # Past the retry budget: keep what was already yielded rather
+                # than discarding a mostly-complete listing.
+                log.warning("Giving up on %s at StartNum=%d: %s", path, start, exc)
+                return
+            if data.get("ReturnCode", 0) != 0:
+                log.debug("Stopping %s: ReturnCode=%s", path, data.get("ReturnCode"))
+                return
+            items = _first_nonempty_list(data, list_keys)
+            if not items:
+                return
+            full_page = len(items) >= batch_size
+            if pool is not None and full_page:
+                # Launch the next page before yielding, so its round-trip runs
+                # while the consumer processes this page.
+                next_future = pool.submit(request, start + batch_size)
+            for item in items:
+                if not keep(item):
+                    continue
+                yield item
+                collected += 1
+                if limit is not None and collected >= limit:
+                    return
+            if on_page:
+                on_page(start, collected)
+            if not full_page:
+                # A short page means the listing is exhausted; skip the final
+                # round-trip that would only confirm it with an empty page.
+                return
+            start += batch_size
+    finally:
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+
+def paginate_concurrent(
+    post: Callable[[str, Dict], Dict],
+    path: str,
+    base_payload: Dict,
+    *,
+    batch_size: int,
+    workers: int,
+    list_keys: Sequence[str] = ("FileList",),
+    keep: Optional[Callable[[Dict], bool]] = None,
+    limit: Optional[int] = None,
+    on_page: Optional[Callable[[int, int], None]] = None,
+) -> Iterator[Dict]:
+    """Like :func:`paginate`, but probes page 1 serially and then fetches
+    ``workers`` pages per wave in parallel.
+
+    Most listings fit in one window, so the probe avoids spinning up the pool
+    (and wasting speculative requests) for them. When page 1 comes back full,
+    page N's round-trip overlaps page N+1..N+workers. Pages are yielded
+    strictly in order, with the same stop conditions as :func:`paginate`; a
+    short or empty page ends the listing, so at most one wave of speculative
+    requests is wasted. Results are identical to the serial version — only the
+    wall time changes.
+    """
+    keep = keep or (lambda _item: True)
+
+    def fetch(page: int) -> Optional[Dict]:
+        start = 1 + (page - 1) * batch_size
         payload = {**base_payload, "StartNum": start, "EndNum": start + batch_size - 1}
         try:
-            data = post(path, payload)
+            return post(path, payload)
         except ValueError:
             log.warning("Non-JSON response for %s at StartNum=%d", path, start)
+            return None
+        except requests.RequestException as exc:
+            log.warning("Giving up on %s at StartNum=%d: %s", path, start, exc)
+            return None
+
+    def page_items(data: Optional[Dict]) -> List[Dict]:
+        if data is None or data.get("ReturnCode", 0) != 0:
+            return []
+        return _first_nonempty_list(data, list_keys)
+
+    collected = 0
+
+    # Serial probe of page 1.
+    data = fetch(1)
+    items = page_items(data)
+    if not items:
+        return
+    for item in items:
+        if not keep(item):
+            continue
+        yield item
+        collected += 1
+        if limit is not None and collected >= limit:
             return
-        if data.get("ReturnCode", 0) != 0:
-            log.debug("Stopping %s: ReturnCode=%s", path, data.get("ReturnCode"))
-            return
-        items = _first_nonempty_list(data, list_keys)
-        if not items:
-            return
-        for item in items:
-            if not keep(item):
-                continue
-            yield item
-            collected += 1
-            if limit is not None and collected >= limit:
-                return
-        if on_page:
-            on_page(start, collected)
-        start += batch_size
+    if on_page:
+        on_page(1, collected)
+    if len(items) < batch_size:
+        return
+
+    # Some endpoints report the listing size on the first page; use it to cap
+    # the fan-out at the exact page count instead of probing past the end.
+    total = data.get("TotalNum") or data.get("UploadCnt")
+    last_page = -(-int(total) // batch_size) if total else None
+    if last_page is not None and last_page <= 1:
+        return
+
+    # Fan out the remaining pages in waves.
+    page = 2
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="servoom-page") as pool:
+        while last_page is None or page <= last_page:
+            stop = page + workers if last_page is None else min(page + workers,
+                                                               last_page + 1)
+            wave = [pool.submit(fetch, p) for p in range(page, stop)]
+            for offset, future in enumerate(wave):
+                items = page_items(future.result())
+                if not items:
+                    return
+                for item in items:
+                    if not keep(item):
+                        continue
+                    yield item
+                    collected += 1
+                    if limit is not None and collected >= limit:
+                        return
+                if on_page:
+                    on_page(1 + (page + offset - 1) * batch_size, collected)
+                if len(items) < batch_size:
+                    return
+            page = stop
 
 
 def collect(items: Iterable[Dict]) -> List[Dict]:
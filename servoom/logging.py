@@ -7,7 +7,10 @@ default the library stays silent (a ``NullHandler``); applications opt in to out
 
 from __future__ import annotations
 
+import atexit
 import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
 
 _ROOT = "servoom"
 
@@ -21,11 +24,24 @@ def get_logger(name: str) -> logging.Logger:
     return logging.getLogger(name)
 
 
-def configure(level: int = logging.INFO) -> None:
-    """Enable simple console logging for the ``servoom`` namespace (for CLIs/scripts)."""
+def configure(level: int = logging.INFO, non_blocking: bool = False) -> None:
+    """Enable simple console logging for the ``servoom`` namespace (for CLIs/scripts).
+
+    With ``non_blocking=True``, records are enqueued and written to the console
+    by a background listener thread, so worker threads (downloads, page
+    prefetch) never block on console I/O or contend for stdout.
+    """
     logger = logging.getLogger(_ROOT)
     logger.setLevel(level)
-    if not any(isinstance(h, logging.StreamHandler) for h in logger.handlers):
-        handler = logging.StreamHandler()
-        handler.setFormatter(logging.Formatter("%(message)s"))
-        logger.addHandler(handler)
+    if any(isinstance(h, (logging.StreamHandler, QueueHandler)) for h in logger.handlers):
+        return
+    console = logging.StreamHandler()
+    console.setFormatter(logging.Formatter("%(message)s"))
+    if non_blocking:
+        record_queue: queue.SimpleQueue = queue.SimpleQueue()
+        listener = QueueListener(record_queue, console)
+        listener.start()
+        atexit.register(listener.stop)
+        logger.addHandler(QueueHandler(record_queue))
+    else:
+        logger.addHandler(console)
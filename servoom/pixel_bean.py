@@ -1,9 +1,16 @@
-from typing import Union, List, Optional, Dict
+from collections import OrderedDict
+from functools import cached_property
+from types import MappingProxyType
+from typing import Union, Iterator, List, Mapping, Optional, Dict
 from enum import Enum
 
 import numpy as np
 from PIL import Image
 
+# Rendered PIL frames kept per instance; bounds memory while letting repeated
+# exports (e.g. save_to_webp then save_to_gif) reuse the same rendered frames.
+_FRAME_CACHE_SIZE = 64
+
 
 class PixelBeanState(Enum):
     """Lifecycle state of a PixelBean."""
@@ -52,10 +59,13 @@ class PixelBean(object):
 
     @property
     def frames_data(self):
-        """List of numpy arrays with frame data (only available when decoded)."""
+        """List of numpy arrays with frame data (only available when decoded).
+
+        Each entry is a zero-copy view into the internal frame stack.
+        """
         if self._state != PixelBeanState.COMPLETE:
             raise ValueError("Animation not decoded yet. Call decode() first.")
-        return self._frames_data
+        return list(self._frames_data)
 
     @property
     def width(self):
@@ -82,21 +92,21 @@ class PixelBean(object):
         return self._file_path
     
     @property
-    def metadata(self) -> Dict:
-        """Artwork metadata dictionary."""
-        return self._metadata.copy()
-    
-    @property
+    def metadata(self) -> Mapping:
+        """Artwork metadata as a read-only mapping (zero-copy view)."""
+        return self._metadata_view
+
+    @cached_property
     def gallery_id(self) -> Optional[int]:
         """Gallery ID from metadata."""
         return self._metadata.get('GalleryId')
-    
-    @property
+
+    @cached_property
     def file_id(self) -> Optional[str]:
         """File ID from metadata."""
         return self._metadata.get('FileId')
-    
-    @property
+
+    @cached_property
     def file_name(self) -> Optional[str]:
         """File name from metadata."""
         return self._metadata.get('FileName')
@@ -110,10 +120,11 @@ class PixelBean(object):
         row_count: Optional[int] = None,
         column_count: Optional[int] = None,
         frames_data: Optional[List[np.ndarray]] = None,
+        _share_metadata: bool = False,
     ):
         """
         Initialize PixelBean.
-        
+
         Args:
             metadata: Dictionary containing artwork metadata (must include GalleryId, FileId, FileName, etc.)
             file_path: Optional path to downloaded Divoom file (.dat)
@@ -122,15 +133,23 @@ class PixelBean(object):
             row_count: Number of 16x16 tile rows (required if frames_data provided)
             column_count: Number of 16x16 tile columns (required if frames_data provided)
             frames_data: List of numpy arrays (one per frame), each of shape (height, width, 3) with RGB values
-            
+            _share_metadata: Internal: adopt ``metadata`` without the defensive
+                copy. Only for callers (bulk construction from freshly parsed
+                responses) that promise never to mutate the dict afterwards.
+
         Note:
             - If only metadata provided: state = METADATA_ONLY
             - If metadata + file_path provided: state = DOWNLOADED
             - If metadata + file_path + frames_data provided: state = COMPLETE
         """
-        self._metadata = metadata.copy()
+        self._metadata = metadata if _share_metadata else metadata.copy()
+        # Handed out by the `metadata` property: read-only, so no per-access
+        # dict copy is needed to protect the internal state.
+        self._metadata_view = MappingProxyType(self._metadata)
         self._file_path = file_path
-        
+        # (frame_number, scale, target_width, target_height) -> rendered Image.
+        self._frame_cache: "OrderedDict[tuple, Image.Image]" = OrderedDict()
+
         # Determine state and validate
         if frames_data is not None:
             # Complete: has decoded animation data
@@ -141,9 +160,10 @@ class PixelBean(object):
             self._speed = speed
             self._row_count = row_count
             self._column_count = column_count
-            self._frames_data = frames_data
+            self._frames_data = self._as_frame_stack(frames_data)
             self._width = column_count * 16
             self._height = row_count * 16
+            self._size = (self._width, self._height)
         elif file_path is not None:
             # Downloaded: has file but not decoded
             self._state = PixelBeanState.DOWNLOADED
@@ -154,6 +174,7 @@ class PixelBean(object):
             self._frames_data = None
             self._width = None
             self._height = None
+            self._size = None
         else:
             # Metadata only
             self._state = PixelBeanState.METADATA_ONLY
@@ -164,6 +185,7 @@ class PixelBean(object):
             self._frames_data = None
             self._width = None
             self._height = None
+            self._size = None
     
     def update_from_download(self, file_path: str) -> None:
         """
@@ -201,9 +223,11 @@ class PixelBean(object):
         self._speed = speed
         self._row_count = row_count
         self._column_count = column_count
-        self._frames_data = frames_data
+        self._frames_data = self._as_frame_stack(frames_data)
         self._width = column_count * 16
         self._height = row_count * 16
+        self._size = (self._width, self._height)
+        self._frame_cache.clear()  # renders of any previous decode are stale
         self._state = PixelBeanState.COMPLETE
 
     def get_frame_image(
@@ -234,66 +258,139 @@ class PixelBean(object):
         if frame_number <= 0 or frame_number > self.total_frames:
             raise Exception('Frame number out of range!')
 
-        # Get the frame as a numpy array (height, width, 3) with RGB values
-        frame_array = self._frames_data[frame_number - 1]
-        
-        # Convert numpy array to PIL Image
-        # numpy array is already in RGB format with shape (height, width, 3)
-        img = Image.fromarray(frame_array.astype(np.uint8), 'RGB')
-
-        img = self._resize(
-            img, scale=scale, target_width=target_width, target_height=target_height
+        target = self._compute_target(
+            *self._size, scale, target_width, target_height
         )
-        return img
+        return self._frame_at(frame_number, target)
 
-    def _resize(
+    def _frame_at(
         self,
-        img: Image,
+        frame_number: int,
+        target: Optional[tuple],
+        scratch: Optional[np.ndarray] = None,
+    ) -> Image:
+        """Render one frame to a PIL image, resized to ``target`` if given.
+
+        Keying the cache on the resolved ``target`` lets different parameter
+        spellings of the same output size (``scale=2`` vs an explicit width)
+        share an entry; copies keep cached pixels immutable. ``scratch`` is an
+        optional preallocated output buffer for the whole-factor upscale path;
+        PIL copies pixels into its own storage, so loops may pass the same
+        buffer for every frame instead of allocating one per frame.
+        """
+        cache_key = (frame_number, target)
+        cached = self._frame_cache.get(cache_key)
+        if cached is not None:
+            self._frame_cache.move_to_end(cache_key)
+            return cached.copy()
+
+        # A zero-copy (height, width, 3) uint8 RGB view into the frame stack;
+        # Image.fromarray hands the buffer over without further conversion.
+        frame_array = self._frames_data[frame_number - 1]
+        factor = self._integer_factor(target)
+        if factor is not None:
+            # Whole-factor pixel-art upscaling is pure pixel duplication
+            # (identical output to NEAREST); a broadcast assignment streams it
+            # at memory bandwidth without PIL's resampler dispatch or an
+            # intermediate small image.
+            if scratch is None:
+                scratch = np.empty((target[1], target[0], 3), np.uint8)
+            scratch.reshape(
+                self._height, factor, self._width, factor, 3
+            )[:] = frame_array[:, None, :, None, :]
+            img = Image.fromarray(scratch, 'RGB')
+        else:
+            img = Image.fromarray(frame_array, 'RGB')
+            if target is not None:
+                img = img.resize(target, Image.NEAREST)
+        self._frame_cache[cache_key] = img.copy()
+        while len(self._frame_cache) > _FRAME_CACHE_SIZE:
+            self._frame_cache.popitem(last=False)
+        return img
+
+    @staticmethod
+    def _as_frame_stack(frames_data) -> np.ndarray:
+        """Normalize frame data to one contiguous ``(N, H, W, 3)`` uint8 stack.
+
+        One arena beats N separate frame allocations for cache locality, and
+        per-frame slices are zero-copy views that are always uint8 and
+        contiguous. Accepts a list of per-frame arrays or an already-stacked
+        array; no copy is made when the input already has the right layout.
+        """
+        if isinstance(frames_data, np.ndarray) and frames_data.ndim == 4:
+            stacked = frames_data
+        else:
+            stacked = np.stack(frames_data)
+        return np.ascontiguousarray(stacked, dtype=np.uint8)
+
+    def _integer_factor(self, target: Optional[tuple]) -> Optional[int]:
+        """Upscaling factor when ``target`` is a whole multiple of the source
+        size (the common 2x/4x/8x pixel-art case), else None."""
+        if target is None:
+            return None
+        factor, remainder = divmod(target[0], self._width)
+        if remainder or factor <= 1 or target[1] != self._height * factor:
+            return None
+        return factor
+
+    @staticmethod
+    def _compute_target(
+        src_width: int,
+        src_height: int,
         scale: Union[int, float] = 1,
         target_width: int = None,
         target_height: int = None,
-    ) -> Image:
+    ) -> Optional[tuple]:
         """
-        Resize image based on scale or target dimensions.
-        
+        Resolve resize parameters to a final (width, height), or None for a no-op.
+
+        All frames of an animation share the same dimensions, so callers
+        rendering many frames compute this once instead of per frame.
+
         Args:
-            img: PIL Image to resize
+            src_width: Source width in pixels
+            src_height: Source height in pixels
             scale: Scale factor (default 1, no scaling)
             target_width: Optional explicit target width
             target_height: Optional explicit target height
-            
+
         Returns:
-            Resized PIL Image
+            Target (width, height) tuple, or None when no resize is needed
         """
         if target_width is not None and target_height is not None:
-            return img.resize((target_width, target_height), Image.NEAREST)
-        elif target_width is not None:
-            new_height = int(img.height * target_width / img.width)
-            return img.resize((target_width, new_height), Image.NEAREST)
-        elif target_height is not None:
-            new_width = int(img.width * target_height / img.height)
-            return img.resize((new_width, target_height), Image.NEAREST)
-        elif scale != 1:
-            new_width = int(img.width * scale)
-            new_height = int(img.height * scale)
-            return img.resize((new_width, new_height), Image.NEAREST)
-        return img
+            return (target_width, target_height)
+        if target_width is not None:
+            return (target_width, int(src_height * target_width / src_width))
+        if target_height is not None:
+            return (int(src_width * target_height / src_height), target_height)
+        if scale != 1:
+            return (int(src_width * scale), int(src_height * scale))
+        return None
 
-    def _render_frames(
+    def _iter_frames(
         self,
         scale: Union[int, float] = 1,
         target_width: int = None,
         target_height: int = None,
-    ) -> List[Image]:
-        """Render every frame to a PIL image (requires COMPLETE state)."""
+    ) -> Iterator[Image]:
+        """Lazily render frames in order (requires COMPLETE state).
+
+        Yielding one frame at a time lets consumers that process frames
+        sequentially (the GIF writer, previews) release each image before the
+        next is rendered, instead of holding the whole animation in PIL
+        buffers at once.
+        """
         if self._state != PixelBeanState.COMPLETE:
             raise ValueError("Animation not decoded yet. Call decode() first.")
-        return [
-            self.get_frame_image(
-                n + 1, scale=scale, target_width=target_width, target_height=target_height
-            )
-            for n in range(self._total_frames)
-        ]
+        target = self._compute_target(
+            *self._size, scale, target_width, target_height
+        )
+        # One upscale buffer reused across the whole animation (PIL copies
+        # pixels out of it when building each image).
+        scratch = (np.empty((target[1], target[0], 3), np.uint8)
+                   if self._integer_factor(target) is not None else None)
+        for n in range(self._total_frames):
+            yield self._frame_at(n + 1, target, scratch)
 
     def save_to_webp(
         self,
@@ -314,15 +411,37 @@ class PixelBean(object):
         Raises:
             ValueError: If animation not decoded yet.
         """
-        frames = self._render_frames(scale, target_width, target_height)
+        frames = self._iter_frames(scale, target_width, target_height)
+        first = next(frames)
         save_kwargs = dict(
-            append_images=frames[1:], duration=self._speed,
+            append_images=frames, duration=self._speed,
             save_all=True, loop=0, disposal=0, lossless=True,
         )
         if hasattr(output, "write"):
-            frames[0].save(output, format="WEBP", **save_kwargs)
+            first.save(output, format="WEBP", **save_kwargs)
         else:
-            frames[0].save(output, **save_kwargs)
+            first.save(output, **save_kwargs)
+
+    def _gif_palette(self) -> Image:
+        """Build one palette image covering every frame of the animation.
+
+        Quantizing each frame against a shared palette runs median-cut once
+        over the whole animation instead of once per frame, and keeps colors
+        stable across frames (per-frame adaptive palettes shift between frames
+        and bloat the GIF with palette tables). Computed from the unscaled
+        frame stack: upscaling duplicates pixels, never adds colors.
+
+        Pixel art usually fits in 256 colors outright, in which case the exact
+        color set becomes the palette and median-cut is skipped entirely.
+        """
+        stacked = self._frames_data
+        colors = np.unique(stacked.reshape(-1, 3), axis=0)
+        if len(colors) <= 256:
+            palette = Image.new('P', (1, 1))
+            palette.putpalette(colors.tobytes())
+            return palette
+        sample = Image.fromarray(stacked.reshape(-1, self._width, 3), 'RGB')
+        return sample.quantize(colors=256, method=Image.MEDIANCUT)
 
     def save_to_gif(
         self,
@@ -343,15 +462,20 @@ class PixelBean(object):
         Raises:
             ValueError: If animation not decoded yet.
         """
-        frames = [
-            img.convert("P", palette=Image.ADAPTIVE)
-            for img in self._render_frames(scale, target_width, target_height)
-        ]
+        palette = self._gif_palette()
+        # The GIF writer consumes append_images lazily, so quantizing inside a
+        # generator keeps at most one full-RGB frame and its quantized form
+        # alive at a time.
+        frames = (
+            img.quantize(palette=palette, dither=Image.Dither.NONE)
+            for img in self._iter_frames(scale, target_width, target_height)
+        )
+        first = next(frames)
         save_kwargs = dict(
-            append_images=frames[1:], duration=self._speed,
+            append_images=frames, duration=self._speed,
             save_all=True, loop=0, disposal=2,
         )
         if hasattr(output, "write"):
-            frames[0].save(output, format="GIF", **save_kwargs)
+            first.save(output, format="GIF", **save_kwargs)
         else:
-            frames[0].save(output, **save_kwargs)
+            first.save(output, **save_kwargs)
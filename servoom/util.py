@@ -2,13 +2,17 @@
 
 from __future__ import annotations
 
+import functools
 import os
 import re
 import sys
 from datetime import datetime
 from typing import Any
 
-_INVALID_FILENAME_CHARS = re.compile(r'[<>:"/\\|?*]')
+# Compiled once at import; the + collapses runs of invalid characters into one
+# replacement instead of substituting each character individually. Control
+# characters are invalid on Windows and unhelpful everywhere else.
+_INVALID_FILENAME_CHARS = re.compile(r'[<>:"/\\|?*\x00-\x1f]+')
 
 
 def sanitize_filename(filename: str, max_length: int = 200) -> str:
@@ -27,9 +31,16 @@ def safe_console_text(value: Any) -> str:
         return text.encode("utf-8", errors="replace").decode("utf-8", errors="replace")
 
 
+@functools.lru_cache(maxsize=4096)
 def convert_epoch_to_local(epoch: int) -> str:
-    """Format a Unix timestamp as ``YYYY-MM-DD HH:MM:SS`` in local time."""
-    return datetime.fromtimestamp(epoch).strftime("%Y-%m-%d %H:%M:%S")
+    """Format a Unix timestamp as ``YYYY-MM-DD HH:MM:SS`` in local time.
+
+    Cached: gallery dumps repeat second-resolution timestamps heavily (burst
+    uploads), and the direct f-string beats ``strftime`` on misses anyway.
+    """
+    dt = datetime.fromtimestamp(epoch)
+    return (f"{dt.year:04d}-{dt.month:02d}-{dt.day:02d} "
+            f"{dt.hour:02d}:{dt.minute:02d}:{dt.second:02d}")
 
 
 def append_timestamp(filename: str) -> str: